@@ -1,30 +1,185 @@
 import json
+import math
 import pickle
 import os
+import re
 import yaml
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, IO, Iterable, Optional, Set, Tuple
 import pandas as pd
 
+# Backends JSON acelerados (opcionais): orjson -> ujson. O json da stdlib é a referência
+# e é usado sempre que o resultado acelerado poderia divergir (NaN/inf, inteiros enormes...).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# orjson converte inteiros fora de [-2**63, 2**64) em float: números com 19+ dígitos
+# seguidos vão para o json da stdlib, que preserva o inteiro exato
+_JSON_LONG_NUMBER = re.compile(rb'\d{19}')
+
+# Loader/Dumper YAML em C (libyaml) quando disponível
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# msgpack opcional: serialização binária compacta para estados intermediários
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Buffer de IO para pickles: agrupa as escritas/leituras pequenas do pickle em blocos de 1 MiB
+_PICKLE_BUFFER_SIZE = 1 << 20
+
+# Cabeçalho dos pickles gravados com buffers out-of-band (protocolo 5).
+# Layout: magic | pickle([len(stream), len(buf_1), ...]) | stream | buf_1 | buf_2 ...
+# Pickles comuns começam com o opcode PROTO (0x80), então não há ambiguidade.
+_PICKLE_OOB_MAGIC = b"MCMLOOB5"
+
+# Diretórios pais já garantidos nesta execução: evita stat+mkdir a cada save
+_MKDIR_CACHE: Set[str] = set()
+
+
+def _parent_dir(file_path: str) -> str:
+    """
+    Diretório pai de file_path, sem abspath (getcwd): caminhos relativos ficam relativos.
+    normpath resolve '..' só no texto (sem syscall), evitando criar diretórios intermediários.
+    """
+    return os.path.normpath(os.path.dirname(file_path))
+
+
+def _ensure_dir(file_path: str) -> str:
+    """Garante que o diretório pai de file_path existe e o retorna."""
+    parent = _parent_dir(file_path)
+    if parent not in _MKDIR_CACHE:
+        os.makedirs(parent, exist_ok=True)
+        _MKDIR_CACHE.add(parent)
+    return parent
+
+
+def _open_output(file_path: str, mode: str, **kwargs) -> IO:
+    """Abre um arquivo para escrita, criando o diretório pai se necessário."""
+    parent = _ensure_dir(file_path)
+    try:
+        return open(file_path, mode, **kwargs)
+    except FileNotFoundError:
+        # Diretório removido depois de entrar no cache (ou caminho relativo após
+        # mudança de cwd): recria e tenta de novo
+        _MKDIR_CACHE.discard(parent)
+        _ensure_dir(file_path)
+        return open(file_path, mode, **kwargs)
+
 
 def load_json(file_path: str) -> Dict[str, Any]:
     """
     Carrega um arquivo JSON e retorna um dicionário.
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Arquivo JSON não encontrado: {file_path}")
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo JSON não encontrado: {file_path}") from None
+
+    # orjson rejeita os tokens NaN/Infinity gravados pelo json da stdlib: nesse caso
+    # (ou em qualquer erro de parsing) a stdlib decide
+    if orjson is not None:
+        if _JSON_LONG_NUMBER.search(raw):
+            return json.loads(raw)
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    elif ujson is not None:
+        try:
+            return ujson.loads(raw)
+        except ValueError:
+            pass
+
+    return json.loads(raw)
+
+
+def _is_plain_json(data: Any) -> bool:
+    """
+    Indica se data só contém dict (chaves str), list, tuple, str, int, float, bool e None,
+    que orjson/ujson e o json da stdlib serializam da mesma forma.
+
+    Tipos exatos: subclasses (Enum, IntEnum...), datetime, UUID, dataclasses, chaves não
+    str, NaN/inf e inteiros fora de 64 bits ficam com a stdlib.
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is dict:
+            for key in item:
+                if type(key) is not str:
+                    return False
+            stack.extend(item.values())
+        elif item_type is list or item_type is tuple:
+            stack.extend(item)
+        elif item_type is float:
+            if not math.isfinite(item):
+                return False
+        elif item_type is int:
+            if not -2**63 <= item < 2**64:
+                return False
+        elif item_type is not str and item_type is not bool and item is not None:
+            return False
+    return True
+
+
+def _orjson_default(obj: Any) -> Any:
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _fast_json_dumps(data: Any, indent: int) -> Optional[bytes]:
+    """
+    Serializa com orjson/ujson; retorna None quando o resultado poderia divergir do
+    json da stdlib, que então é usado.
+    """
+    if (orjson is None and ujson is None) or not _is_plain_json(data):
+        return None
+
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=_orjson_default, option=option)
+        except orjson.JSONEncodeError:
+            return None
+
+    if ujson is not None:
+        try:
+            return ujson.dumps(data, indent=indent, ensure_ascii=False,
+                               escape_forward_slashes=False).encode('utf-8')
+        except (OverflowError, TypeError, ValueError):
+            return None
+
+    return None
 
 
 def save_json(data: Dict[str, Any], file_path: str, indent: int = 4) -> None:
     """
     Salva um dicionário em um arquivo JSON.
+
+    Nota: com o backend orjson, qualquer indent não nulo é gravado com 2 espaços.
+    NaN e ±inf são gravados como NaN/Infinity, como no json da stdlib.
     """
-    # Garante que o diretório pai existe
-    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+    payload = _fast_json_dumps(data, indent)
+    if payload is not None:
+        with _open_output(file_path, 'wb') as f:
+            f.write(payload)
+        return
     
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with _open_output(file_path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=indent, ensure_ascii=False)
 
 
@@ -32,42 +187,162 @@ def load_yaml(file_path: str) -> Dict[str, Any]:
     """
     Carrega um arquivo YAML e retorna um dicionário.
     """
-    with open(file_path, "r", encoding='utf-8') as file:
-        return yaml.safe_load(file)
+    try:
+        with open(file_path, "r", encoding='utf-8') as file:
+            return yaml.load(file, Loader=_YamlLoader)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo YAML não encontrado: {file_path}") from None
 
 
 def save_yaml(data: Dict[str, Any], file_path: str) -> None:
     """
     Salva um dicionário em arquivo YAML.
     """
-    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        yaml.safe_dump(data, f, sort_keys=False)
+    with _open_output(file_path, 'w', encoding='utf-8') as f:
+        yaml.dump(data, f, Dumper=_YamlDumper, sort_keys=False)
+
+
+def _read_exact(f: IO, size: int) -> bytearray:
+    """Lê exatamente size bytes direto para um bytearray (sem cópia intermediária)."""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    pos = 0
+    while pos < size:
+        n = f.readinto(view[pos:])
+        if not n:
+            raise pickle.UnpicklingError("Arquivo Pickle truncado: buffers out-of-band incompletos.")
+        pos += n
+    return buffer
 
 
 def load_pickle(file_path: str) -> Any:
-    """Carrega um objeto de um arquivo .pkl."""
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Arquivo Pickle não encontrado: {file_path}")
-        
-    with open(file_path, 'rb') as f:
-        return pickle.load(f)
+    """Carrega um objeto de um arquivo .pkl (comum ou salvo com oob=True)."""
+    # Só o open() fica no try: FileNotFoundError vindo de __setstate__/__reduce__ não é reescrito
+    try:
+        f = open(file_path, 'rb', buffering=_PICKLE_BUFFER_SIZE)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo Pickle não encontrado: {file_path}") from None
 
+    with f:
+        if f.read(len(_PICKLE_OOB_MAGIC)) != _PICKLE_OOB_MAGIC:
+            f.seek(0)
+            return pickle.load(f)
 
-def save_pickle(data: Any, file_path: str) -> None:
-    """Salva qualquer objeto Python em um arquivo .pkl."""
-    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
-    
-    with open(file_path, 'wb') as f:
-        pickle.dump(data, f)
+        stream_size, *buffer_sizes = pickle.load(f)
+        stream = _read_exact(f, stream_size)
+        buffers = [_read_exact(f, size) for size in buffer_sizes]
+        return pickle.loads(stream, buffers=buffers)
+
+
+def save_pickle(data: Any, file_path: str, protocol: int = pickle.HIGHEST_PROTOCOL,
+                oob: bool = False) -> None:
+    """
+    Salva qualquer objeto Python em um arquivo .pkl (protocolo binário mais recente por padrão).
+
+    Args:
+        data: Objeto a ser salvo.
+        file_path: Caminho do arquivo de destino.
+        protocol: Protocolo do pickle.
+        oob: Se True, usa buffers out-of-band (protocolo 5): arrays NumPy grandes são
+            gravados direto da memória, sem cópia para o stream do pickle. O arquivo
+            resultante só é lido por load_pickle.
+    """
+    if not oob:
+        with _open_output(file_path, 'wb', buffering=_PICKLE_BUFFER_SIZE) as f:
+            pickle.dump(data, f, protocol=protocol)
+        return
+
+    buffers = []
+    stream = pickle.dumps(data, protocol=max(protocol, 5), buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+
+    with _open_output(file_path, 'wb', buffering=_PICKLE_BUFFER_SIZE) as f:
+        f.write(_PICKLE_OOB_MAGIC)
+        pickle.dump([len(stream)] + [raw.nbytes for raw in raw_buffers], f, protocol=protocol)
+        f.write(stream)
+        for raw in raw_buffers:
+            f.write(raw)
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ImportError("msgpack não está instalado. Instale com: pip install msgpack")
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Converte arrays e escalares NumPy para tipos nativos aceitos pelo msgpack."""
+    tolist = getattr(obj, 'tolist', None)
+    if tolist is None:
+        raise TypeError(f"Objeto não serializável em msgpack: {type(obj).__name__}")
+    return tolist()
+
+
+def load_msgpack(file_path: str) -> Any:
+    """Carrega um objeto de um arquivo msgpack."""
+    _require_msgpack()
+    try:
+        f = open(file_path, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo msgpack não encontrado: {file_path}") from None
+
+    with f:
+        return msgpack.unpack(f, raw=False, strict_map_key=False)
+
+
+def save_msgpack(data: Any, file_path: str) -> None:
+    """
+    Salva um objeto em formato msgpack (binário, mais rápido que JSON/Pickle).
+    Arrays NumPy são gravados como listas e tuplas são lidas de volta como listas.
+    """
+    _require_msgpack()
+    with _open_output(file_path, 'wb') as f:
+        msgpack.pack(data, f, use_bin_type=True, default=_msgpack_default)
 
 
 def load_csv(file_path: str, **kwargs) -> pd.DataFrame:
     """
     Carrega um arquivo CSV em um DataFrame do Pandas.
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Arquivo CSV não encontrado: {file_path}")
-    
-    return pd.read_csv(file_path, **kwargs)
\ No newline at end of file
+    try:
+        return pd.read_csv(file_path, **kwargs)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo CSV não encontrado: {file_path}") from None
+
+
+# Funções de escrita usadas por save_many, indexadas pelo formato
+_SAVERS = {
+    'json': save_json,
+    'yaml': save_yaml,
+    'pickle': save_pickle,
+    'msgpack': save_msgpack,
+}
+
+
+def _save_job(job: Tuple[Any, str, str]) -> None:
+    data, file_path, fmt = job
+    _SAVERS[fmt](data, file_path)
+
+
+def save_many(jobs: Iterable[Tuple[Any, str, str]], max_workers: Optional[int] = None) -> None:
+    """
+    Salva vários arquivos em paralelo com um pool de threads limitado.
+    Útil para gravar todos os artefatos ao final de um experimento.
+
+    Args:
+        jobs: Tuplas (data, file_path, formato), com formato 'json', 'yaml', 'pickle' ou 'msgpack'.
+        max_workers: Número máximo de threads (padrão: min(32, 2 * núcleos)).
+    """
+    jobs = list(jobs)
+    for _, file_path, fmt in jobs:
+        if fmt not in _SAVERS:
+            raise ValueError(f"Formato não suportado em save_many: '{fmt}' ({file_path})")
+
+    if not jobs:
+        return
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 2)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        # list() propaga a primeira exceção de escrita para o chamador
+        list(executor.map(_save_job, jobs))
@@ -1,7 +1,65 @@
+import errno
 import os
 import shutil
+import stat
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, TextIO
+
+# Buffer dos arquivos mantidos abertos por save_text(append=True)
+_WRITER_BUFFER_SIZE = 1 << 16
+
+# Limites do bloco por chamada de os.copy_file_range em copy_file
+_COPY_MIN_BLOCK = 1 << 20
+_COPY_MAX_BLOCK = 1 << 30
+
+
+def _copy_file_range(src_path: str, dst_path: str) -> bool:
+    """
+    Copia src_path -> dst_path dentro do kernel com os.copy_file_range (Linux).
+
+    Sem passar os dados pelo espaço de usuário; em Btrfs/XFS/NFS 4.2 vira reflink
+    ou cópia no servidor. Retorna False se a chamada não for suportada, para que
+    o chamador use shutil.copyfile.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return False
+
+    # FIFOs e outros arquivos especiais bloqueiam no open(): shutil.copyfile os rejeita
+    if not stat.S_ISREG(os.stat(src_path).st_mode):
+        return False
+
+    with open(src_path, 'rb') as fsrc:
+        src_stat = os.fstat(fsrc.fileno())
+        dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT, 0o666)
+        try:
+            # Só trunca o destino depois de garantir que não é o próprio arquivo fonte
+            dst_stat = os.fstat(dst_fd)
+            if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+                raise shutil.SameFileError(f"{src_path!r} e {dst_path!r} são o mesmo arquivo")
+            os.ftruncate(dst_fd, 0)
+
+            block = min(max(src_stat.st_size, _COPY_MIN_BLOCK), _COPY_MAX_BLOCK)
+            copied = 0
+            try:
+                while True:
+                    n = os.copy_file_range(fsrc.fileno(), dst_fd, block)
+                    if n == 0:
+                        # 0 logo na primeira chamada: arquivo vazio ou procfs/sysfs (st_size 0,
+                        # kernels 5.3-5.18 não copiam nada); shutil.copyfile trata os dois casos
+                        if not copied:
+                            return False
+                        break
+                    copied += n
+            except OSError as e:
+                # Sem suporte (EXDEV, ENOSYS, EINVAL...) antes de copiar qualquer byte
+                if e.errno == errno.ENOSPC or copied:
+                    raise
+                return False
+        finally:
+            os.close(dst_fd)
+
+    return True
+
 
 class ExperimentFolder:
     """
@@ -31,6 +89,9 @@ class ExperimentFolder:
         os.makedirs(self.path, exist_ok=False)
         self._finalized = False
 
+        # Arquivos de texto mantidos abertos entre chamadas de save_text(append=True)
+        self._open_writers: Dict[str, TextIO] = {}
+
 
     def get_folder_name(self) -> str:
         """Retorna o nome da pasta do experimento."""
@@ -50,20 +111,52 @@ class ExperimentFolder:
             src_path: Caminho do arquivo original.
             new_name: (Opcional) Novo nome do arquivo no destino.
         """
-        if not os.path.exists(src_path):
-            raise FileNotFoundError(f"Arquivo fonte não encontrado: {src_path}")
-            
         filename = new_name if new_name else os.path.basename(src_path)
         dst_path = self.get_path(filename)
-        shutil.copyfile(src_path, dst_path)
+        try:
+            if not _copy_file_range(src_path, dst_path):
+                shutil.copyfile(src_path, dst_path)
+        except FileNotFoundError as e:
+            if e.filename != src_path:
+                raise
+            raise FileNotFoundError(f"Arquivo fonte não encontrado: {src_path}") from None
+
 
+    def save_text(self, filename: str, content: str, append: bool = False) -> None:
+        """
+        Salva uma string em um arquivo de texto simples.
+
+        Args:
+            filename: Nome do arquivo dentro da pasta do experimento.
+            content: Texto a ser gravado.
+            append: Se True, acrescenta ao final do arquivo e o mantém aberto para as
+                próximas chamadas (fechado em finish() ou close_writers()).
+        """
+        if append:
+            writer = self._open_writers.get(filename)
+            if writer is None:
+                writer = open(self.get_path(filename), 'a', encoding='utf-8',
+                              buffering=_WRITER_BUFFER_SIZE)
+                self._open_writers[filename] = writer
+            writer.write(content)
+            return
+
+        # Fecha um writer aberto do mesmo arquivo para não intercalar escritas
+        writer = self._open_writers.pop(filename, None)
+        if writer is not None:
+            writer.close()
 
-    def save_text(self, filename: str, content: str) -> None:
-        """Salva uma string em um arquivo de texto simples."""
         with open(self.get_path(filename), 'w', encoding='utf-8') as f:
             f.write(content)
 
 
+    def close_writers(self) -> None:
+        """Descarrega e fecha os arquivos mantidos abertos por save_text(append=True)."""
+        for writer in self._open_writers.values():
+            writer.close()
+        self._open_writers.clear()
+
+
     def finish(self, status: str = "success", info_msg: str = "") -> None:
         """
         Finaliza o experimento renomeando a pasta com um sufixo (_Success, _Fail).
@@ -83,6 +176,8 @@ class ExperimentFolder:
             log_name = "Success.txt" if status.lower() == "success" else "Error.txt"
             self.save_text(log_name, info_msg)
 
+        self.close_writers()
+
         try:
             os.rename(self.path, new_path)
             self.path = new_path
@@ -0,0 +1,27 @@
+"""
+Kernels Numba de math.converters, importados sob demanda no primeiro array grande
+para que `import numba` não pese na importação do pacote.
+
+Sem fastmath: mantém a semântica IEEE de log(0) = -inf e log(x < 0) = NaN
+usada pelos modos 'warn' e 'ignore'.
+"""
+import numpy as np
+from numba import njit, prange
+
+from .converters import _10_OVER_LN10, _LN10_OVER_10
+
+
+@njit(parallel=True, cache=True)
+def lin2db_kernel(x):
+    out = np.empty_like(x)
+    for i in prange(x.size):
+        out[i] = _10_OVER_LN10 * np.log(x[i])
+    return out
+
+
+@njit(parallel=True, cache=True)
+def db2lin_kernel(x):
+    out = np.empty_like(x)
+    for i in prange(x.size):
+        out[i] = np.exp(_LN10_OVER_10 * x[i])
+    return out
@@ -1,5 +1,8 @@
+import math
+import operator
 import numpy as np
 import warnings
+from functools import lru_cache
 from typing import Union, List, Literal
 from scipy.constants import c as SPEED_OF_LIGHT
 
@@ -8,26 +11,199 @@ from scipy.constants import c as SPEED_OF_LIGHT
 ArrayLike = Union[float, int, List[float], np.ndarray]
 ErrorMode = Literal['raise', 'warn', 'ignore']
 
+# Tipos tratados pelo caminho escalar (math), sem passar por np.asanyarray
+_SCALAR_TYPES = (float, int)
+
+# Entradas escalares memoizadas (setpoints de potência repetidos em simulações)
+_SCALAR_CACHE_SIZE = 1024
+
+# Velocidade da luz em nm/s: evita o array temporário da conversão m <-> nm
+_C_NM = SPEED_OF_LIGHT * 1e9
+
+# Constantes de conversão via log/exp naturais: 10*log10(x) == _10_OVER_LN10*ln(x)
+_10_OVER_LN10 = 4.342944819032518
+_LN10_OVER_10 = 0.23025850929940458
+
+# Tamanho mínimo de array para compensar o overhead de despacho dos kernels Numba
+_NUMBA_MIN_SIZE = 10_000
+
+# Kernels Numba opcionais (pip install numba), importados no primeiro array grande.
+# None: ainda não carregados; False: numba indisponível.
+_numba_kernels = None
+
+
+def _get_numba_kernels(value: np.ndarray):
+    """Retorna o módulo de kernels Numba se o array deve usá-los, senão None."""
+    global _numba_kernels
+    if _numba_kernels is False or type(value) is not np.ndarray or value.size < _NUMBA_MIN_SIZE:
+        return None
+
+    if _numba_kernels is None:
+        try:
+            from . import _numba_kernels as kernels
+        except ImportError:
+            _numba_kernels = False
+            return None
+        _numba_kernels = kernels
+    return _numba_kernels
+
 
 # ==========================================
 # Funções Auxiliares de Segurança
 # ==========================================
 
+def _invalid_message(context: str) -> str:
+    return (f"Entrada inválida em '{context}': valores devem ser estritamente positivos (> 0). "
+            f"Encontrados valores <= 0 ou NaN.")
+
+
+def _raise_invalid(context: str):
+    raise ValueError(_invalid_message(context))
+
+
+def _warn_invalid(context: str):
+    warnings.warn(_invalid_message(context), RuntimeWarning)
+
+
+def _ignore_invalid(context: str):
+    pass
+
+
+# Ação de cada ErrorMode, resolvida por consulta ao dicionário (modos desconhecidos são ignorados)
+_MODE_ACTIONS = {
+    'raise': _raise_invalid,
+    'warn': _warn_invalid,
+    'ignore': _ignore_invalid,
+}
+
+
 def _validate_positive(value: np.ndarray, mode: ErrorMode, context: str):
     """
     Valida se os valores são estritamente positivos.
     """
-    if mode == 'ignore':
+    action = _MODE_ACTIONS.get(mode, _ignore_invalid)
+    if action is _ignore_invalid:
+        return
+
+    if not value.size:
         return
 
-    if np.any(value <= 0):
-        msg = (f"Entrada inválida em '{context}': valores devem ser estritamente positivos (> 0). "
-               f"Encontrados valores <= 0 ou NaN.")
-        
-        if mode == 'raise':
-            raise ValueError(msg)
-        elif mode == 'warn':
-            warnings.warn(msg, RuntimeWarning)
+    # Uma única redução, sem a máscara booleana intermediária de (value <= 0)
+    lowest = value.min()
+    # min() propaga NaN e esconderia negativos: só nesse caso refaz a checagem completa
+    if lowest <= 0 or (lowest != lowest and np.any(value <= 0)):
+        action(context)
+
+
+# ==========================================
+# Caminho Escalar (float/int do Python)
+# ==========================================
+# Mesma semântica das versões NumPy: log(0) = -inf, log(x < 0) = NaN, c / 0 = inf.
+# A validação fica fora do cache para que 'raise'/'warn' atuem em toda chamada.
+
+@lru_cache(maxsize=_SCALAR_CACHE_SIZE)
+def _lin2db_scalar(value: float) -> float:
+    """10 * log10(value) para um escalar estritamente positivo."""
+    return 10.0 * math.log10(value)
+
+
+@lru_cache(maxsize=_SCALAR_CACHE_SIZE)
+def _db2lin_scalar(value_db: float) -> float:
+    """10^(value_db / 10) para um escalar (exato para dB inteiros, como no baseline)."""
+    # Fora do try: int grande demais para float gera OverflowError, como em np.asanyarray
+    exponent = float(value_db) / 10.0
+    try:
+        return 10.0 ** exponent
+    except OverflowError:
+        return math.inf
+
+
+def _log_scalar(value: float, mode: ErrorMode, context: str) -> float:
+    """10 * log10(value) para um escalar, validando conforme o modo."""
+    # int grande demais para float gera OverflowError, como em np.asanyarray
+    value = float(value)
+    if value > 0:
+        return _lin2db_scalar(value)
+
+    if value <= 0:
+        _MODE_ACTIONS.get(mode, _ignore_invalid)(context)
+    return -math.inf if value == 0 else math.nan
+
+
+def _div_scalar(value: float, numerator: float, mode: ErrorMode, context: str) -> float:
+    """numerator / value para um escalar, validando conforme o modo."""
+    value = float(value)
+    if value <= 0:
+        _MODE_ACTIONS.get(mode, _ignore_invalid)(context)
+
+    if value == 0:
+        return math.copysign(math.inf, value)
+    return numerator / value
+
+
+def _dbm2watt_scalar(power_dbm: float) -> float:
+    """10^((power_dbm - 30) / 10) para um escalar (compartilha o cache de db2lin)."""
+    return _db2lin_scalar(power_dbm - 30.0)
+
+
+# ==========================================
+# Caminho Vetorial (NumPy)
+# ==========================================
+# Recebem qualquer entrada aceita por np.asanyarray e sempre retornam arrays.
+
+def _log_array(value: ArrayLike, mode: ErrorMode, context: str) -> np.ndarray:
+    """10 * log10(value) elemento a elemento, validando conforme o modo."""
+    value = np.asanyarray(value, dtype=float)
+    _validate_positive(value, mode, context)
+
+    kernels = _get_numba_kernels(value)
+    if kernels is not None:
+        return kernels.lin2db_kernel(value.ravel()).reshape(value.shape)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return _10_OVER_LN10 * np.log(value)
+
+
+def _db2lin_array(value_db: ArrayLike) -> np.ndarray:
+    """10^(value_db / 10) elemento a elemento."""
+    value_db = np.asanyarray(value_db, dtype=float)
+
+    kernels = _get_numba_kernels(value_db)
+    if kernels is not None:
+        return kernels.db2lin_kernel(value_db.ravel()).reshape(value_db.shape)
+    return np.exp(_LN10_OVER_10 * value_db)
+
+
+def _dbm2watt_array(power_dbm: ArrayLike) -> np.ndarray:
+    """10^((power_dbm - 30) / 10) elemento a elemento."""
+    return np.exp(_LN10_OVER_10 * (np.asanyarray(power_dbm, dtype=float) - 30.0))
+
+
+def _div_array(value: ArrayLike, numerator: float, mode: ErrorMode, context: str) -> np.ndarray:
+    """numerator / value elemento a elemento, validando conforme o modo."""
+    value = np.asanyarray(value, dtype=float)
+    _validate_positive(value, mode, context)
+
+    with np.errstate(divide='ignore'):
+        return numerator / value
+
+
+def _dispatch(value: ArrayLike, scalar_impl, array_impl, *args):
+    """
+    Escolhe uma única vez a implementação escalar (math) ou vetorial (NumPy).
+
+    Arrays NumPy vão direto para a versão vetorial; listas e escalares NumPy são
+    convertidos e despachados conforme a dimensão resultante.
+    """
+    if type(value) in _SCALAR_TYPES:
+        return scalar_impl(value, *args)
+    if isinstance(value, np.ndarray):
+        return array_impl(value, *args)
+
+    value = np.asanyarray(value, dtype=float)
+    if value.ndim == 0:
+        return scalar_impl(value.item(), *args)
+    return array_impl(value, *args)
 
 
 # ==========================================
@@ -44,13 +220,7 @@ def lin2db(value: ArrayLike, mode: ErrorMode = 'raise') -> Union[float, np.ndarr
         value: Valor linear ou array.
         mode: 'raise', 'warn', 'ignore'.
     """
-    value = np.asanyarray(value, dtype=float)
-    _validate_positive(value, mode, context='lin2db')
-
-    with np.errstate(divide='ignore', invalid='ignore'):
-        result = 10 * np.log10(value)
-
-    return result.item() if result.ndim == 0 else result
+    return _dispatch(value, _log_scalar, _log_array, mode, 'lin2db')
 
 
 def db2lin(value_db: ArrayLike) -> Union[float, np.ndarray]:
@@ -58,9 +228,7 @@ def db2lin(value_db: ArrayLike) -> Union[float, np.ndarray]:
     Converte valor em dB para escala linear (adimensional).
     Fórmula: 10^(value_db / 10)
     """
-    value_db = np.asanyarray(value_db, dtype=float)
-    result = 10 ** (value_db / 10.0)
-    return result.item() if result.ndim == 0 else result
+    return _dispatch(value_db, _db2lin_scalar, _db2lin_array)
 
 
 # ==========================================
@@ -72,13 +240,7 @@ def watt2dbm(power_watt: ArrayLike, mode: ErrorMode = 'raise') -> Union[float, n
     Converte potência em Watts para dBm.
     Fórmula: 10 * log10(power_watt) + 30
     """
-    value = np.asanyarray(power_watt, dtype=float)
-    _validate_positive(value, mode, context='watt2dbm')
-
-    with np.errstate(divide='ignore', invalid='ignore'):
-        result = 10 * np.log10(value) + 30.0
-
-    return result.item() if result.ndim == 0 else result
+    return _dispatch(power_watt, _log_scalar, _log_array, mode, 'watt2dbm') + 30.0
 
 
 def dbm2watt(power_dbm: ArrayLike) -> Union[float, np.ndarray]:
@@ -86,9 +248,7 @@ def dbm2watt(power_dbm: ArrayLike) -> Union[float, np.ndarray]:
     Converte potência em dBm para Watts.
     Fórmula: 10 ** ((dBm - 30) / 10)
     """
-    value_db = np.asanyarray(power_dbm, dtype=float)
-    result = 10 ** ((value_db - 30.0) / 10.0)
-    return result.item() if result.ndim == 0 else result
+    return _dispatch(power_dbm, _dbm2watt_scalar, _dbm2watt_array)
 
 
 def watt2db(power_watt: ArrayLike, mode: ErrorMode = 'raise') -> Union[float, np.ndarray]:
@@ -115,55 +275,31 @@ def db2watt(value_db: ArrayLike) -> Union[float, np.ndarray]:
 
 def freq_Hz_to_wavelength_m(freq_Hz: ArrayLike, mode: ErrorMode = 'raise') -> Union[float, np.ndarray]:
     """Converte Frequência (Hz) -> Comprimento de onda (m)."""
-    freq = np.asanyarray(freq_Hz, dtype=float)
-    _validate_positive(freq, mode, context='freq_Hz_to_wavelength_m')
-    
-    with np.errstate(divide='ignore'):
-        result = SPEED_OF_LIGHT / freq
-        
-    return result.item() if result.ndim == 0 else result
+    return _dispatch(freq_Hz, _div_scalar, _div_array, SPEED_OF_LIGHT, mode, 'freq_Hz_to_wavelength_m')
 
 
 def wavelength_m_to_freq_Hz(wavelength_m: ArrayLike, mode: ErrorMode = 'raise') -> Union[float, np.ndarray]:
     """Converte Comprimento de onda (m) -> Frequência (Hz)."""
-    wl = np.asanyarray(wavelength_m, dtype=float)
-    _validate_positive(wl, mode, context='wavelength_m_to_freq_Hz')
-    
-    with np.errstate(divide='ignore'):
-        result = SPEED_OF_LIGHT / wl
-        
-    return result.item() if result.ndim == 0 else result
+    return _dispatch(wavelength_m, _div_scalar, _div_array, SPEED_OF_LIGHT, mode, 'wavelength_m_to_freq_Hz')
 
 
 def wavelength_nm_to_freq_Hz(wavelength_nm: ArrayLike, mode: ErrorMode = 'raise') -> Union[float, np.ndarray]:
     """Converte Comprimento de onda (nm) -> Frequência (Hz)."""
-    wl_nm = np.asanyarray(wavelength_nm, dtype=float)
-    _validate_positive(wl_nm, mode, context='wavelength_nm_to_freq_Hz')
-    
-    with np.errstate(divide='ignore'):
-        # nm para m: * 1e-9
-        result = SPEED_OF_LIGHT / (wl_nm * 1e-9)
-        
-    return result.item() if result.ndim == 0 else result
+    # c / (nm * 1e-9) == (c * 1e9) / nm
+    return _dispatch(wavelength_nm, _div_scalar, _div_array, _C_NM, mode, 'wavelength_nm_to_freq_Hz')
 
 
 def freq_Hz_to_wavelength_nm(freq_Hz: ArrayLike, mode: ErrorMode = 'raise') -> Union[float, np.ndarray]:
     """Converte Frequência (Hz) -> Comprimento de onda (nm)."""
-    freq = np.asanyarray(freq_Hz, dtype=float)
-    _validate_positive(freq, mode, context='freq_Hz_to_wavelength_nm')
-    
-    with np.errstate(divide='ignore'):
-        # m para nm: * 1e9
-        result = (SPEED_OF_LIGHT / freq) * 1e9
-        
-    return result.item() if result.ndim == 0 else result
+    # (c / freq) * 1e9 == (c * 1e9) / freq
+    return _dispatch(freq_Hz, _div_scalar, _div_array, _C_NM, mode, 'freq_Hz_to_wavelength_nm')
 
 
 def freq_GHz_to_Hz(freq_GHz: ArrayLike) -> Union[float, np.ndarray]:
     """Converte GHz -> Hz."""
-    return np.asanyarray(freq_GHz, dtype=float) * 1e9
+    return _dispatch(freq_GHz, operator.mul, np.multiply, 1e9)
 
 
 def freq_Hz_to_GHz(freq_Hz: ArrayLike) -> Union[float, np.ndarray]:
     """Converte Hz -> GHz."""
-    return np.asanyarray(freq_Hz, dtype=float) / 1e9
\ No newline at end of file
+    return _dispatch(freq_Hz, operator.truediv, np.true_divide, 1e9)